@@ -10,36 +10,73 @@ PYDANTIC_VERSION_TUPLE = tuple(map(int, PYDANTIC_VERSION.split('.')))
 
 if PYDANTIC_V1:  # pragma: no cover
     class PydanticCompat:  # type: ignore
-        obj: pydantic.BaseModel
+        model_fields: dict[str, FieldInfo]
+        model_field_annotations: dict[str, type]
 
         def __init__(
             self,
-            obj: pydantic.BaseModel,
+            model: type[pydantic.BaseModel],
         ) -> None:
-            self.obj = obj
-
-        @property
-        def model_fields(self) -> dict[str, FieldInfo]:
-            return self.obj.__fields__
+            self.model_fields = model.__fields__
+            self.model_field_annotations = {
+                field_name: model_field.type_  # type: ignore
+                for field_name, model_field
+                in self.model_fields.items()
+            }
 
         def get_model_field_info_annotation(self, model_field: FieldInfo) -> type:
             return model_field.type_  # type: ignore
 
 elif PYDANTIC_V2:  # pragma: no cover
     class PydanticCompat:  # type: ignore
-        obj: pydantic.BaseModel
+        model_fields: dict[str, FieldInfo]
+        model_field_annotations: dict[str, Any]
 
         def __init__(
             self,
-            obj: pydantic.BaseModel,
+            model: type[pydantic.BaseModel],
         ) -> None:
-            self.obj = obj
-
-        @property
-        def model_fields(self) -> dict[str, FieldInfo]:
-            return self.obj.model_fields
+            self.model_fields = model.model_fields
+            self.model_field_annotations = {
+                field_name: model_field.annotation
+                for field_name, model_field
+                in self.model_fields.items()
+                if model_field.annotation is not None
+            }
 
         def get_model_field_info_annotation(self, model_field: FieldInfo) -> type[Any]:
             if model_field.annotation is None:
                 raise RuntimeError("model field has not typing annotation")
-            return model_field.annotation
+            return model_field.annotation  # type: ignore
+
+
+def is_model_complete(model: type[pydantic.BaseModel]) -> bool:
+    """
+    Return True if the model class is complete, so its fields will not change anymore.
+
+    pydantic v2 models may still change their fields on `model_rebuild()` as long as
+    they are not complete. This is only true for pydantic v2, pydantic v1 models are
+    always seen as complete.
+    """
+
+    return getattr(model, "__pydantic_complete__", True)
+
+
+def get_pydantic_compat(model: type[pydantic.BaseModel]) -> "PydanticCompat":  # pyright: ignore[reportPossiblyUnbound]
+    """
+    Return the PydanticCompat instance for the given model class.
+
+    The instance is created once and stored on the model class itself, so all
+    instances of the model share it. Storing it on the class (instead of some
+    global cache) ensures dynamically created models can still be garbage
+    collected. We are using `__dict__` to not pick up the instance of a parent
+    model, which might have a different set of fields. Incomplete models will
+    not store the instance.
+    """
+
+    compat = model.__dict__.get("__pydantic_changedetect_compat__")
+    if compat is None:
+        compat = PydanticCompat(model)
+        if is_model_complete(model):
+            model.__pydantic_changedetect_compat__ = compat  # type: ignore
+    return compat
@@ -1,11 +1,15 @@
 import datetime
 import decimal
+import functools
 import warnings
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    Container,
     Dict,  # We still need to use this, as dict is a class method and pollutes the class scope
+    Iterable,
+    Iterator,
     Literal,
     Optional,
     TypeVar,
@@ -17,7 +21,13 @@ from typing import (
 
 import pydantic
 
-from ._compat import PYDANTIC_V1, PYDANTIC_V2, PYDANTIC_VERSION_TUPLE, PydanticCompat
+from ._compat import (
+    PYDANTIC_V1,
+    PYDANTIC_V2,
+    PYDANTIC_VERSION_TUPLE,
+    get_pydantic_compat,
+    is_model_complete,
+)
 from .utils import is_pydantic_change_detect_annotation
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -39,6 +49,12 @@ COMPARABLE_TYPES = (
     datetime.datetime, datetime.date, datetime.time, datetime.timedelta,
     pydantic.BaseModel,
 )
+COMPARABLE_EXACT_TYPES = frozenset(COMPARABLE_TYPES)
+
+# Attribute kinds, see ChangeDetectionMixin._model_attribute_kinds()
+UNKNOWN_ATTRIBUTE = 0
+FIELD_ATTRIBUTE = 1
+PRIVATE_ATTRIBUTE = 2
 
 
 class ChangeDetectionMixin(pydantic.BaseModel):
@@ -75,10 +91,6 @@ class ChangeDetectionMixin(pydantic.BaseModel):
 
     __slots__ = ("model_changed_markers", "model_original", "model_self_changed_fields")
 
-    def __init__(self, **kwargs: Any) -> None:
-        super().__init__(**kwargs)
-        self.model_reset_changed()
-
     def model_reset_changed(self) -> None:
         """
         Reset the changed state, this will clear model_self_changed_fields, model_original
@@ -89,101 +101,233 @@ class ChangeDetectionMixin(pydantic.BaseModel):
         object.__setattr__(self, "model_self_changed_fields", set())
         object.__setattr__(self, "model_changed_markers", set())
 
-    @property
-    def model_changed_fields(self) -> set[str]:
-        """Return list of all changed fields, submodels are considered as one field"""
+    def _model_copy_changed_state(self, clone: "ChangeDetectionMixin") -> None:
+        """Copy the changed state to a clone of this instance, so they will not share it."""
 
-        self_compat = PydanticCompat(self)
+        object.__setattr__(clone, "model_original", self.model_original.copy())
+        object.__setattr__(clone, "model_self_changed_fields", self.model_self_changed_fields.copy())
+        object.__setattr__(clone, "model_changed_markers", self.model_changed_markers.copy())
 
-        changed_fields = self.model_self_changed_fields.copy()
-        for field_name, model_field in self_compat.model_fields.items():
+    @classmethod
+    def _model_nested_change_detect_fields(cls) -> frozenset[str]:
+        """
+        Return names of all fields which may contain ChangeDetectionMixin instances
+        inside list/dict structures, based on the field annotations.
+
+        This is calculated only once per class, as the annotations will not change.
+        """
+
+        nested_fields = cls.__dict__.get("__pydantic_changedetect_nested_fields__")
+        if nested_fields is None:
+            nested_fields = frozenset(
+                field_name
+                for field_name, annotation
+                in get_pydantic_compat(cls).model_field_annotations.items()
+                if is_pydantic_change_detect_annotation(annotation)
+            )
+            if is_model_complete(cls):
+                cls.__pydantic_changedetect_nested_fields__ = nested_fields  # type: ignore
+        return nested_fields
+
+    @classmethod
+    def _model_change_detect_fields(cls) -> tuple[tuple[str, bool], ...]:
+        """
+        Return all fields to walk when looking for changes of nested ChangeDetectionMixin
+        instances, as `(field_name, is_nested_field)` tuples. `is_nested_field` tells
+        whether the field may contain those inside list/dict structures, see
+        `_model_nested_change_detect_fields()`.
+
+        This is calculated only once per class, as the fields will not change.
+        """
+
+        change_detect_fields = cls.__dict__.get("__pydantic_changedetect_fields__")
+        if change_detect_fields is None:
+            nested_fields = cls._model_nested_change_detect_fields()
+            change_detect_fields = tuple(
+                (field_name, field_name in nested_fields)
+                for field_name
+                in get_pydantic_compat(cls).model_fields
+            )
+            if is_model_complete(cls):
+                cls.__pydantic_changedetect_fields__ = change_detect_fields  # type: ignore
+        return change_detect_fields
+
+    @classmethod
+    def _model_attribute_kinds(cls) -> Dict[str, int]:
+        """
+        Return mapping of attribute names to their kind (FIELD_ATTRIBUTE or
+        PRIVATE_ATTRIBUTE), so `__setattr__()` only needs one lookup per call.
+
+        This is calculated only once per class, as the attributes will not change.
+        """
+
+        attribute_kinds = cls.__dict__.get("__pydantic_changedetect_attribute_kinds__")
+        if attribute_kinds is None:
+            attribute_kinds = dict.fromkeys(get_pydantic_compat(cls).model_fields, FIELD_ATTRIBUTE)
+            attribute_kinds.update(
+                dict.fromkeys(cls.__private_attributes__ or (), PRIVATE_ATTRIBUTE),  # may be None
+            )
+            if is_model_complete(cls):
+                cls.__pydantic_changedetect_attribute_kinds__ = attribute_kinds  # type: ignore
+        return attribute_kinds
+
+    def _model_iter_nested_changed_fields(
+        self,
+        include: Optional[Container[str]] = None,
+    ) -> Iterator[str]:
+        """
+        Yield names of all fields containing changed ChangeDetectionMixin instances,
+        either directly or inside list/dict structures.
+
+        As this is a generator, callers only interested in whether anything has
+        changed can stop after the first result. Passing `include` will only check
+        the given fields.
+        """
+
+        self_dict = self.__dict__
+
+        change_detect_fields: Iterable[tuple[str, bool]] = self._model_change_detect_fields()
+        if include is not None:
+            change_detect_fields = [
+                change_detect_field
+                for change_detect_field
+                in change_detect_fields
+                if change_detect_field[0] in include
+            ]
+
+        for field_name, is_nested_field in change_detect_fields:
             # Support for instances created through model_construct, when not all fields have been defined
-            if field_name not in self.__dict__:
+            if field_name not in self_dict:
                 continue
 
-            field_value = self.__dict__[field_name]
+            field_value = self_dict[field_name]
 
             # Value is a ChangeDetectionMixin instance itself
+            # (checking the self changed state first avoids walking the nested model
+            # through model_has_changed, when the nested model was changed directly)
             if (
                 isinstance(field_value, ChangeDetectionMixin)
-                and field_value.model_has_changed
+                and (
+                    field_value.model_self_changed_fields
+                    or field_value.model_changed_markers
+                    or field_value.model_has_changed
+                )
             ):
-                changed_fields.add(field_name)
+                yield field_name
 
             # Field contains ChangeDetectionMixin's, but inside list/dict structure
             elif (
-                field_value
-                and is_pydantic_change_detect_annotation(
-                    self_compat.get_model_field_info_annotation(model_field),
-                )
+                is_nested_field
+                and field_value
             ):
-                # Collect all possible values
-                if isinstance(field_value, (list, tuple)):
-                    field_value_list = field_value
+                # Collect all possible values, checking the exact type first as this
+                # is cheaper than isinstance() and matches what pydantic validation creates
+                field_value_type = type(field_value)
+                field_values: Iterable[Any]
+                if field_value_type is list or field_value_type is tuple:
+                    field_values = field_value
+                elif field_value_type is dict:
+                    field_values = cast("dict[Any, Any]", field_value).values()
+                elif isinstance(field_value, (list, tuple)):
+                    field_values = field_value
                 elif isinstance(field_value, dict):
-                    field_value_list = list(field_value.values())
+                    field_values = field_value.values()
                 else:  # pragma: no cover
                     # Continue on unsupported type
                     # (should be already filtered by is_pydantic_change_detect_annotation)
                     continue
 
                 # Check if any of the values has changed
-                for inner_field_value in field_value_list:
+                for inner_field_value in field_values:
                     if (
                         isinstance(inner_field_value, ChangeDetectionMixin)
-                        and inner_field_value.model_has_changed
+                        and (
+                            inner_field_value.model_self_changed_fields
+                            or inner_field_value.model_changed_markers
+                            or inner_field_value.model_has_changed
+                        )
                     ):
-                        changed_fields.add(field_name)
+                        yield field_name
                         break
 
+    @property
+    def model_changed_fields(self) -> set[str]:
+        """Return list of all changed fields, submodels are considered as one field"""
+
+        changed_fields = self.model_self_changed_fields.copy()
+        changed_fields.update(self._model_iter_nested_changed_fields())
         return changed_fields
 
     @property
     def model_changed_fields_recursive(self) -> set[str]:
         """Return a list of all changed fields recursive using dotted syntax"""
 
-        self_compat = PydanticCompat(self)
+        changed_fields: set[str] = set()
 
-        changed_fields = self.model_self_changed_fields.copy()
-        for field_name, model_field in self_compat.model_fields.items():
-            field_value = self.__dict__[field_name]
+        # Walk all nested models using a stack of (prefix, model) instead of recursion,
+        # so we only need to build one set for the whole tree
+        stack: list[tuple[str, ChangeDetectionMixin]] = [("", self)]
+        while stack:
+            prefix, model = stack.pop()
+            model_dict = model.__dict__
 
-            # Value is a ChangeDetectionMixin instance itself
-            if (
-                    isinstance(field_value, ChangeDetectionMixin)
-                    and field_value.model_has_changed
-            ):
-                changed_fields.add(field_name)
-                for changed_field in field_value.model_changed_fields_recursive:
-                    changed_fields.add(f"{field_name}.{changed_field}")
+            for changed_field in model.model_self_changed_fields:
+                changed_fields.add(f"{prefix}{changed_field}")
 
-            # Field contains ChangeDetectionMixin's, but inside list/dict structure
-            elif (
-                field_value
-                and is_pydantic_change_detect_annotation(
-                    self_compat.get_model_field_info_annotation(model_field),
-                )
-            ):
-                # Collect all possible values
-                if isinstance(field_value, (list, tuple)):
-                    field_value_list = list(enumerate(field_value))
-                elif isinstance(field_value, dict):
-                    field_value_list = list(field_value.items())
-                else:  # pragma: no cover
-                    # Continue on unsupported type
-                    # (should be already filtered by is_pydantic_change_detect_annotation)
+            for field_name, is_nested_field in model._model_change_detect_fields():
+                # Support for instances created through model_construct, when not all fields have been defined
+                if field_name not in model_dict:
                     continue
 
-                # Check if any of the values has changed
-                for inner_field_index, inner_field_value in field_value_list:
-                    if (
-                        isinstance(inner_field_value, ChangeDetectionMixin)
-                        and inner_field_value.model_has_changed
-                    ):
-                        for changed_field in inner_field_value.model_changed_fields_recursive:
-                            changed_fields.add(f"{field_name}.{inner_field_index}.{changed_field}")
-                        changed_fields.add(f"{field_name}.{inner_field_index}")
-                        changed_fields.add(f"{field_name}")
+                field_value = model_dict[field_name]
+
+                # Value is a ChangeDetectionMixin instance itself
+                # (see `_model_iter_nested_changed_fields()` for the self changed state check)
+                if (
+                        isinstance(field_value, ChangeDetectionMixin)
+                        and (
+                            field_value.model_self_changed_fields
+                            or field_value.model_changed_markers
+                            or field_value.model_has_changed
+                        )
+                ):
+                    changed_fields.add(f"{prefix}{field_name}")
+                    stack.append((f"{prefix}{field_name}.", field_value))
+
+                # Field contains ChangeDetectionMixin's, but inside list/dict structure
+                elif (
+                    is_nested_field
+                    and field_value
+                ):
+                    # Collect all possible values, see `_model_iter_nested_changed_fields()`
+                    field_value_type = type(field_value)
+                    field_value_items: Iterable[tuple[Any, Any]]
+                    if field_value_type is list or field_value_type is tuple:
+                        field_value_items = enumerate(field_value)
+                    elif field_value_type is dict:
+                        field_value_items = cast("dict[Any, Any]", field_value).items()
+                    elif isinstance(field_value, (list, tuple)):
+                        field_value_items = enumerate(field_value)
+                    elif isinstance(field_value, dict):
+                        field_value_items = field_value.items()
+                    else:  # pragma: no cover
+                        # Continue on unsupported type
+                        # (should be already filtered by is_pydantic_change_detect_annotation)
+                        continue
+
+                    # Check if any of the values has changed
+                    for inner_field_index, inner_field_value in field_value_items:
+                        if (
+                            isinstance(inner_field_value, ChangeDetectionMixin)
+                            and (
+                                inner_field_value.model_self_changed_fields
+                                or inner_field_value.model_changed_markers
+                                or inner_field_value.model_has_changed
+                            )
+                        ):
+                            changed_fields.add(f"{prefix}{field_name}.{inner_field_index}")
+                            changed_fields.add(f"{prefix}{field_name}")
+                            stack.append((f"{prefix}{field_name}.{inner_field_index}.", inner_field_value))
 
         return changed_fields
 
@@ -194,7 +338,8 @@ class ChangeDetectionMixin(pydantic.BaseModel):
         if self.model_self_changed_fields or self.model_changed_markers:
             return True
 
-        return bool(self.model_changed_fields)
+        # Stop on the first changed nested field, no need to collect all of them
+        return next(self._model_iter_nested_changed_fields(), None) is not None
 
     @overload
     def model_set_changed(self, *fields: str) -> None: ...
@@ -209,8 +354,6 @@ class ChangeDetectionMixin(pydantic.BaseModel):
         Optionally provide an original value for the field.
         """
 
-        self_compat = PydanticCompat(self)
-
         # Ensure we have a valid call
         if original is not NO_VALUE and len(fields) > 1:
             raise RuntimeError(
@@ -218,71 +361,82 @@ class ChangeDetectionMixin(pydantic.BaseModel):
                 "changing one field.",
             )
 
-        # Ensure all fields exists
+        # Ensure all fields exists (before changing anything)
+        attribute_kinds = self._model_attribute_kinds()
         for name in fields:
-            if name not in self_compat.model_fields:
+            if attribute_kinds.get(name) != FIELD_ATTRIBUTE:
                 raise AttributeError(f"Field {name} not available in this model")
 
         # Mark fields as changed
+        model_original = self.model_original
+        model_self_changed_fields = self.model_self_changed_fields
+        use_current_value = original is NO_VALUE
         for name in fields:
-            if original is NO_VALUE:
-                self.model_original[name] = self.__dict__[name]
-            else:
-                self.model_original[name] = original
-            self.model_self_changed_fields.add(name)
+            model_original[name] = self.__dict__[name] if use_current_value else original
+            model_self_changed_fields.add(name)
 
     def _model_value_is_comparable_type(self, value: Any) -> bool:
-        if isinstance(value, (list, set, tuple)):
-            return all(
-                self._model_value_is_comparable_type(i)
-                for i
-                in value
-            )
-        elif isinstance(value, dict):
-            return all(
-                (
-                    self._model_value_is_comparable_type(k)
-                    and self._model_value_is_comparable_type(v)
-                )
-                for k, v
-                in value.items()
-            )
+        # Fast path for plain values, checking the exact type first as this is cheaper
+        # than isinstance()
+        if value is None or type(value) in COMPARABLE_EXACT_TYPES:
+            return True
 
-        return (
-            value is None
-            or isinstance(value, COMPARABLE_TYPES)
-        )
+        # Walk all nested list/set/tuple/dict values using a stack instead of recursion,
+        # containers already visited are skipped (so self-referencing values terminate)
+        stack: list[Any] = [value]
+        visited: set[int] = set()
+        while stack:
+            item = stack.pop()
+            if item is None or type(item) in COMPARABLE_EXACT_TYPES:
+                continue
+            if isinstance(item, (list, set, tuple)):
+                if id(item) not in visited:
+                    visited.add(id(item))
+                    stack.extend(item)
+            elif isinstance(item, dict):
+                if id(item) not in visited:
+                    visited.add(id(item))
+                    stack.extend(item)
+                    stack.extend(item.values())
+            elif not isinstance(item, COMPARABLE_TYPES):
+                return False
+
+        return True
 
     def _model_value_is_actually_unchanged(self, value1: Any, value2: Any) -> bool:
         return value1 == value2
 
     @no_type_check
     def __setattr__(self, name, value) -> None:  # noqa: ANN001
-        self_compat = PydanticCompat(self)
+        attribute_kind = self._model_attribute_kinds().get(name, UNKNOWN_ATTRIBUTE)
 
         # Private attributes need not to be handled
-        if (
-            self.__private_attributes__  # may be None
-            and name in self.__private_attributes__
-        ):
+        if attribute_kind == PRIVATE_ATTRIBUTE:
+            super().__setattr__(name, value)
+            return
+
+        model_original = self.model_original
+
+        # Field was changed before, so it will stay changed whatever the new value is
+        if attribute_kind == FIELD_ATTRIBUTE and name in model_original:
             super().__setattr__(name, value)
+            self.model_self_changed_fields.add(name)
             return
 
-        # Get original value
-        original_update = {}
-        if name in self_compat.model_fields and name not in self.model_original:
-            original_update[name] = self.__dict__[name]
+        # Get original value (NO_VALUE if this is not a field)
+        original_value = NO_VALUE
+        if attribute_kind == FIELD_ATTRIBUTE:
+            original_value = self.__dict__[name]
 
         # Store changed value using pydantic
         super().__setattr__(name, value)
 
         # Check if value has actually been changed
         has_changed = True
-        if name in self_compat.model_fields:
-            # Fetch original from original_update so we don't have to check everything again
-            original_value = original_update.get(name, None)
+        if attribute_kind == FIELD_ATTRIBUTE:
             # Don't use value parameter directly, as pydantic validation might have changed it
-            # (when validate_assignment == True)
+            # (when validate_assignment == True). Also pydantic may replace `__dict__` on
+            # validated assignments, so we need to fetch it again here.
             current_value = self.__dict__[name]
             if (
                 self._model_value_is_comparable_type(original_value)
@@ -293,14 +447,24 @@ class ChangeDetectionMixin(pydantic.BaseModel):
 
         # Store changed state
         if has_changed:
-            self.model_original.update(original_update)
+            if original_value is not NO_VALUE:
+                model_original[name] = original_value
             self.model_self_changed_fields.add(name)
 
     def __getstate__(self) -> Dict[str, Any]:
         state = super().__getstate__()
-        state["model_original"] = self.model_original.copy()
-        state["model_self_changed_fields"] = self.model_self_changed_fields.copy()
-        state["model_changed_markers"] = self.model_changed_markers.copy()
+        if PYDANTIC_V2:
+            # pydantic v2 implements `__copy__()`/`__deepcopy__()`, so this is only used for
+            # pickling - which will serialize the current state anyway. pydantic itself
+            # also does not copy `__dict__` here.
+            state["model_original"] = self.model_original
+            state["model_self_changed_fields"] = self.model_self_changed_fields
+            state["model_changed_markers"] = self.model_changed_markers
+        else:  # pragma: no cover
+            # pydantic v1 uses the state for `copy.copy()`, too - so we need to copy
+            state["model_original"] = self.model_original.copy()
+            state["model_self_changed_fields"] = self.model_self_changed_fields.copy()
+            state["model_changed_markers"] = self.model_changed_markers.copy()
         return state
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
@@ -318,28 +482,26 @@ class ChangeDetectionMixin(pydantic.BaseModel):
         else:
             object.__setattr__(self, "model_changed_markers", set())
 
-    def _get_changed_export_includes(
-        self,
-        exclude_unchanged: bool,
-        **kwargs: Any,
-    ) -> Dict[str, Any]:
+    def _get_changed_export_include(self, include: Any) -> Any:
         """
-        Return updated kwargs for json()/dict(), so only changed fields
-        get exported when exclude_unchanged=True
+        Return the include argument for model_dump()/dict()/json() (and their JSON
+        variants), so only changed fields get exported when exclude_unchanged=True
         """
 
-        if exclude_unchanged:
-            changed_fields = self.model_changed_fields
-            if "include" in kwargs and kwargs["include"] is not None:
-                kwargs["include"] = {  # calculate intersect
-                    i
-                    for i
-                    in kwargs["include"]
-                    if i in changed_fields
-                }
-            else:
-                kwargs["include"] = set(changed_fields)
-        return kwargs
+        if include is not None and not include:
+            # Nothing will be included anyway, no need to collect the changed fields
+            return include
+
+        if include is not None:
+            # calculate intersect, this works for sets and mappings (using their keys). We
+            # only check the included fields for nested changes, as the others would be
+            # dropped anyway.
+            changed_fields = self.model_self_changed_fields.intersection(include)
+            changed_fields.update(self._model_iter_nested_changed_fields(include))
+            return changed_fields
+
+        # model_changed_fields always returns a new set, no need to copy it again
+        return self.model_changed_fields
 
     # Restore model/value state
 
@@ -355,15 +517,28 @@ class ChangeDetectionMixin(pydantic.BaseModel):
         * value is a ChangeDetectionMixin instance itself
         """
 
-        if isinstance(value, list):
+        # Fast path for plain values, which will be returned as is
+        value_type = type(value)
+        if value is None or value_type in COMPARABLE_EXACT_TYPES:
+            return value
+
+        if value_type is list or isinstance(value, list):
+            # Lists only containing plain values can be copied as is
+            if all(type(v) in COMPARABLE_EXACT_TYPES for v in value):
+                return list(value)
+            restore_value = cls.model_restore_value
             return [
-                cls.model_restore_value(v)
+                restore_value(v)
                 for v
                 in value
             ]
-        elif isinstance(value, dict):
+        elif value_type is dict or isinstance(value, dict):
+            # Same for dicts only containing plain values
+            if all(type(v) in COMPARABLE_EXACT_TYPES for v in value.values()):
+                return dict(value)
+            restore_value = cls.model_restore_value
             return {
-                k: cls.model_restore_value(v)
+                k: restore_value(v)
                 for k, v
                 in value.items()
             }
@@ -380,21 +555,24 @@ class ChangeDetectionMixin(pydantic.BaseModel):
     ) -> "Model":
         """Restore original state of a ChangeDetectionMixin object."""
 
-        restored_values = {}
-        for key, value in self.__dict__.items():
-            restored_values[key] = self.model_restore_value(value)
+        # Fields with an original value don't need to be restored, the original
+        # value will be used instead
+        model_original = self.model_original
+        restore_value = self.model_restore_value
+        restored_values = {
+            key: restore_value(value)
+            for key, value
+            in self.__dict__.items()
+            if key not in model_original
+        }
+        restored_values.update(model_original)
 
-        return self.__class__(
-            **{
-                **restored_values,
-                **self.model_original,
-            },
-        )
+        return self.__class__(**restored_values)
 
     def model_get_original_field_value(self, field_name: str, /) -> Any:
         """Return original value for a field."""
 
-        self_compat = PydanticCompat(self)
+        self_compat = get_pydantic_compat(type(self))
 
         if field_name not in self_compat.model_fields:
             raise AttributeError(f"Field {field_name} not available in this model")
@@ -402,8 +580,12 @@ class ChangeDetectionMixin(pydantic.BaseModel):
         if field_name in self.model_original:
             return self.model_original[field_name]
 
-        current_value = getattr(self, field_name)
-        return self.model_restore_value(current_value)
+        # Read the value from `__dict__` directly, instances created through
+        # model_construct might not have all fields defined
+        self_dict = self.__dict__
+        if field_name not in self_dict:
+            raise AttributeError(f"Field {field_name} not available in this model")
+        return self.model_restore_value(self_dict[field_name])
 
     # Changed markers
 
@@ -446,14 +628,36 @@ class ChangeDetectionMixin(pydantic.BaseModel):
             super().model_post_init(__context)
             self.model_reset_changed()
 
+        @classmethod
+        def __pydantic_init_subclass__(cls, **kwargs: Any) -> None:
+            super().__pydantic_init_subclass__(**kwargs)
+
+            # pydantic v2 will call model_post_init() for every validated instance, so we
+            # don't need to override __init__() (which would force pydantic to use the slower
+            # custom init code path). Subclasses or other bases (depending on the MRO) might
+            # override model_post_init() without calling super() though, so we ensure the
+            # changed state is still reset by wrapping whatever model_post_init() is used.
+            # This needs to happen after pydantic did set up the class, as pydantic may
+            # replace model_post_init() itself (to initialize private attributes).
+            model_post_init: Callable[..., None] = cls.model_post_init
+            if (
+                model_post_init is not ChangeDetectionMixin.model_post_init
+                and not getattr(model_post_init, "__pydantic_changedetect_wrapped__", False)
+            ):
+                @functools.wraps(model_post_init)
+                def wrapped_model_post_init(self: "ChangeDetectionMixin", context: Any, /) -> None:
+                    model_post_init(self, context)
+                    self.model_reset_changed()
+
+                wrapped_model_post_init.__pydantic_changedetect_wrapped__ = True  # type: ignore
+                cls.model_post_init = wrapped_model_post_init  # type: ignore
+
         def __copy__(self: "Model") -> "Model":
             clone = cast(
                 "Model",
                 super().__copy__(),
             )
-            object.__setattr__(clone, "model_original", self.model_original.copy())
-            object.__setattr__(clone, "model_self_changed_fields", self.model_self_changed_fields.copy())
-            object.__setattr__(clone, "model_changed_markers", self.model_changed_markers.copy())
+            self._model_copy_changed_state(clone)
             return clone
 
         def __deepcopy__(self: "Model", memo: Optional[Dict[int, Any]] = None) -> "Model":
@@ -461,9 +665,7 @@ class ChangeDetectionMixin(pydantic.BaseModel):
                 "Model",
                 super().__deepcopy__(memo=memo),
             )
-            object.__setattr__(clone, "model_original", self.model_original.copy())
-            object.__setattr__(clone, "model_self_changed_fields", self.model_self_changed_fields.copy())
-            object.__setattr__(clone, "model_changed_markers", self.model_changed_markers.copy())
+            self._model_copy_changed_state(clone)
             return clone
 
         if PYDANTIC_VERSION_TUPLE >= (2, 7, 0):
@@ -490,21 +692,21 @@ class ChangeDetectionMixin(pydantic.BaseModel):
                 Extends normal pydantic method to also allow to use `exclude_unchanged`.
                 """
 
+                if exclude_unchanged:
+                    include = self._get_changed_export_include(include)
+
                 return super().model_dump(
-                    **self._get_changed_export_includes(
-                        mode=mode,
-                        include=include,
-                        exclude=exclude,
-                        context=context,
-                        by_alias=by_alias,
-                        exclude_unset=exclude_unset,
-                        exclude_defaults=exclude_defaults,
-                        exclude_none=exclude_none,
-                        exclude_unchanged=exclude_unchanged,
-                        round_trip=round_trip,
-                        warnings=warnings,
-                        serialize_as_any=serialize_as_any,
-                    ),
+                    mode=mode,
+                    include=include,
+                    exclude=exclude,
+                    context=context,
+                    by_alias=by_alias,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                    round_trip=round_trip,
+                    warnings=warnings,
+                    serialize_as_any=serialize_as_any,
                 )
 
             def model_dump_json(  # pyright: ignore [reportRedeclaration]
@@ -530,21 +732,21 @@ class ChangeDetectionMixin(pydantic.BaseModel):
                 Extends normal pydantic method to also allow to use `exclude_unchanged`.
                 """
 
+                if exclude_unchanged:
+                    include = self._get_changed_export_include(include)
+
                 return super().model_dump_json(
-                    **self._get_changed_export_includes(
-                        indent=indent,
-                        include=include,
-                        exclude=exclude,
-                        context=context,
-                        by_alias=by_alias,
-                        exclude_unset=exclude_unset,
-                        exclude_defaults=exclude_defaults,
-                        exclude_none=exclude_none,
-                        exclude_unchanged=exclude_unchanged,
-                        round_trip=round_trip,
-                        warnings=warnings,
-                        serialize_as_any=serialize_as_any,
-                    ),
+                    indent=indent,
+                    include=include,
+                    exclude=exclude,
+                    context=context,
+                    by_alias=by_alias,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                    round_trip=round_trip,
+                    warnings=warnings,
+                    serialize_as_any=serialize_as_any,
                 )
         else:  # Version 2.x < 2.7.0
             def model_dump(  # pyright: ignore [reportIncompatibleMethodOverride]
@@ -568,19 +770,19 @@ class ChangeDetectionMixin(pydantic.BaseModel):
                 Extends normal pydantic method to also allow to use `exclude_unchanged`.
                 """
 
+                if exclude_unchanged:
+                    include = self._get_changed_export_include(include)
+
                 return super().model_dump(
-                    **self._get_changed_export_includes(
-                        mode=mode,
-                        include=include,
-                        exclude=exclude,
-                        by_alias=by_alias,
-                        exclude_unset=exclude_unset,
-                        exclude_defaults=exclude_defaults,
-                        exclude_none=exclude_none,
-                        exclude_unchanged=exclude_unchanged,
-                        round_trip=round_trip,
-                        warnings=warnings,
-                    ),
+                    mode=mode,
+                    include=include,
+                    exclude=exclude,
+                    by_alias=by_alias,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                    round_trip=round_trip,
+                    warnings=warnings,
                 )
 
             def model_dump_json(  # pyright: ignore [reportIncompatibleMethodOverride]
@@ -604,19 +806,19 @@ class ChangeDetectionMixin(pydantic.BaseModel):
                 Extends normal pydantic method to also allow to use `exclude_unchanged`.
                 """
 
+                if exclude_unchanged:
+                    include = self._get_changed_export_include(include)
+
                 return super().model_dump_json(
-                    **self._get_changed_export_includes(
-                        indent=indent,
-                        include=include,
-                        exclude=exclude,
-                        by_alias=by_alias,
-                        exclude_unset=exclude_unset,
-                        exclude_defaults=exclude_defaults,
-                        exclude_none=exclude_none,
-                        exclude_unchanged=exclude_unchanged,
-                        round_trip=round_trip,
-                        warnings=warnings,
-                    ),
+                    indent=indent,
+                    include=include,
+                    exclude=exclude,
+                    by_alias=by_alias,
+                    exclude_unset=exclude_unset,
+                    exclude_defaults=exclude_defaults,
+                    exclude_none=exclude_none,
+                    round_trip=round_trip,
+                    warnings=warnings,
                 )
 
     # Compatibility for pydantic 2.0 compatibility methods to support pydantic 1.0 migration 🙈
@@ -643,9 +845,7 @@ class ChangeDetectionMixin(pydantic.BaseModel):
                 deep=deep,
             ),
         )
-        object.__setattr__(clone, "model_original", self.model_original.copy())
-        object.__setattr__(clone, "model_self_changed_fields", self.model_self_changed_fields.copy())
-        object.__setattr__(clone, "model_changed_markers", self.model_changed_markers.copy())
+        self._model_copy_changed_state(clone)
         return clone
 
     if PYDANTIC_V2:
@@ -668,16 +868,16 @@ class ChangeDetectionMixin(pydantic.BaseModel):
             specifying which fields to include or exclude.
             """
 
+            if exclude_unchanged:
+                include = self._get_changed_export_include(include)
+
             return super().dict(
-                **self._get_changed_export_includes(
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    exclude_unchanged=exclude_unchanged,
-                ),
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
             )
 
         def json(  # type: ignore
@@ -696,22 +896,26 @@ class ChangeDetectionMixin(pydantic.BaseModel):
             arguments as per `dict()`.
             """
 
+            if exclude_unchanged:
+                include = self._get_changed_export_include(include)
+
             return super().json(
-                **self._get_changed_export_includes(
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    exclude_unchanged=exclude_unchanged,
-                    **dumps_kwargs,
-                ),
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                **dumps_kwargs,
             )
 
     # Compatibility methods for pydantic v1
 
     if PYDANTIC_V1:  # pragma: no cover
+        def __init__(self, **kwargs: Any) -> None:
+            super().__init__(**kwargs)
+            self.model_reset_changed()
+
         @classmethod
         def construct(cls: type["Model"], *args: Any, **kwargs: Any) -> "Model":
             """Construct an unvalidated instance"""
@@ -739,9 +943,7 @@ class ChangeDetectionMixin(pydantic.BaseModel):
                     deep=deep,
                 ),
             )
-            object.__setattr__(clone, "model_original", self.model_original.copy())
-            object.__setattr__(clone, "model_self_changed_fields", self.model_self_changed_fields.copy())
-            object.__setattr__(clone, "model_changed_markers", self.model_changed_markers.copy())
+            self._model_copy_changed_state(clone)
             return clone
 
         def dict(  # type: ignore[misc]
@@ -761,17 +963,17 @@ class ChangeDetectionMixin(pydantic.BaseModel):
             specifying which fields to include or exclude.
             """
 
+            if exclude_unchanged:
+                include = self._get_changed_export_include(include)
+
             return super().dict(
-                **self._get_changed_export_includes(
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    skip_defaults=skip_defaults,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    exclude_unchanged=exclude_unchanged,
-                ),
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                skip_defaults=skip_defaults,  # pyright: ignore [reportCallIssue]  # pydantic v1 only
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
             )
 
         def json(  # type: ignore[misc]
@@ -793,20 +995,20 @@ class ChangeDetectionMixin(pydantic.BaseModel):
             arguments as per `dict()`.
             """
 
+            if exclude_unchanged:
+                include = self._get_changed_export_include(include)
+
             return super().json(
-                **self._get_changed_export_includes(
-                    include=include,
-                    exclude=exclude,
-                    by_alias=by_alias,
-                    skip_defaults=skip_defaults,
-                    exclude_unset=exclude_unset,
-                    exclude_defaults=exclude_defaults,
-                    exclude_none=exclude_none,
-                    exclude_unchanged=exclude_unchanged,
-                    encoder=encoder,
-                    models_as_dict=models_as_dict,
-                    **dumps_kwargs,
-                ),
+                include=include,
+                exclude=exclude,
+                by_alias=by_alias,
+                skip_defaults=skip_defaults,
+                exclude_unset=exclude_unset,
+                exclude_defaults=exclude_defaults,
+                exclude_none=exclude_none,
+                encoder=encoder,
+                models_as_dict=models_as_dict,
+                **dumps_kwargs,
             )
 
     # Compatibility methods for older versions of pydantic-changedetect
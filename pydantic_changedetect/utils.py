@@ -39,6 +39,11 @@ def safe_issubclass(cls: Any, type_: Any) -> bool:
         return False
 
 
+# Generic origins of supported containers, see is_pydantic_change_detect_annotation()
+SEQUENCE_ORIGINS = frozenset((List, list, Set, set, Tuple, tuple))
+MAPPING_ORIGINS = frozenset((Dict, dict, Mapping))
+
+
 def is_class_type(annotation: Any) -> bool:
     # If the origin is None, it's likely a concrete class
     return get_origin(annotation) is None
@@ -50,29 +55,20 @@ def is_pydantic_change_detect_annotation(annotation: type[Any]) -> bool:
     """
 
     # if annotation is an ChangeDetectionMixin everything is easy
+    # Note: We are checking the MRO instead of using issubclass(), as pydantic models
+    # use ABCMeta, which would add every checked class to its subclass check caches.
     if (
         is_class_type(annotation)
         and isinstance(annotation, type)
-        and issubclass(annotation, pydantic_changedetect.ChangeDetectionMixin)
+        and pydantic_changedetect.ChangeDetectionMixin in annotation.__mro__
     ):
         return True
 
     # Otherwise we may need to handle typing arguments
     origin = get_origin(annotation)
-    if (
-        origin is List
-        or origin is list
-        or origin is Set
-        or origin is set
-        or origin is Tuple
-        or origin is tuple
-    ):
+    if origin in SEQUENCE_ORIGINS:
         return is_pydantic_change_detect_annotation(get_args(annotation)[0])
-    elif (
-        origin is Dict
-        or origin is dict
-        or origin is Mapping
-    ):
+    elif origin in MAPPING_ORIGINS:
         return is_pydantic_change_detect_annotation(get_args(annotation)[1])
     elif origin is Union:
         # Note: This includes Optional, as Optional[...] is just Union[..., None]
@@ -1,3 +1,4 @@
+import copy
 import datetime
 import decimal
 import pickle
@@ -47,6 +48,70 @@ class NestedWithDefault(ChangeDetectionMixin, pydantic.BaseModel):
     sub: Something = Something(id=1)
 
 
+class SomethingValidated(ChangeDetectionMixin, pydantic.BaseModel, validate_assignment=True):
+    id: int
+
+
+class SomethingPrivate(Something):
+    _private: Optional[int] = pydantic.PrivateAttr(None)
+
+
+class SomethingPostInitWithoutSuper(ChangeDetectionMixin, pydantic.BaseModel):
+    id: int
+
+    def model_post_init(self, context: Any, /) -> None:
+        pass
+
+
+class SomethingPrivatePostInitWithoutSuper(SomethingPostInitWithoutSuper):
+    _private: int = pydantic.PrivateAttr(5)
+
+    def model_post_init(self, context: Any, /) -> None:
+        pass
+
+
+class SomethingPostInitWithSuper(ChangeDetectionMixin, pydantic.BaseModel):
+    id: int
+
+    def model_post_init(self, context: Any, /) -> None:
+        super().model_post_init(context)
+        self.id = self.id + 1
+
+
+class SomethingPrivatePostInitWithSuper(ChangeDetectionMixin, pydantic.BaseModel):
+    id: int
+    _private: int = pydantic.PrivateAttr(5)
+
+    def model_post_init(self, context: Any, /) -> None:
+        super().model_post_init(context)
+        self.id = self.id + 1
+
+
+class BasePostInitWithoutSuper(pydantic.BaseModel):
+    def model_post_init(self, context: Any, /) -> None:
+        pass
+
+
+class SomethingInheritedPostInit(BasePostInitWithoutSuper, ChangeDetectionMixin):
+    id: int
+
+
+class SomethingInheritedPostInitSubclass(SomethingInheritedPostInit):
+    pass
+
+
+class SomethingPrivateInheritedPostInit(SomethingInheritedPostInit):
+    _private: int = pydantic.PrivateAttr(5)
+
+
+class NestedDeep(ChangeDetectionMixin, pydantic.BaseModel):
+    sub: list[Nested]
+
+
+class NestedAny(ChangeDetectionMixin, pydantic.BaseModel):
+    sub: Any
+
+
 class SomethingWithBrokenPickleState(Something):
     def __getstate__(self) -> dict[str, Any]:
         # Skip adding changed state in ChangedDetectionMixin.__getstate__
@@ -84,6 +149,18 @@ def test_changed_state():
     assert obj.model_changed_fields == {"id"}
 
 
+def test_changed_state_keeps_first_original():
+    obj = Something(id=1)
+
+    obj.id = 2
+    obj.id = 3
+    obj.id = 1
+
+    assert obj.model_has_changed
+    assert obj.model_original == {"id": 1}
+    assert obj.model_changed_fields == {"id"}
+
+
 def test_set_changed_state():
     obj = Something(id=1)
 
@@ -118,17 +195,29 @@ def test_set_changed_will_disallow_invalid_field_names():
         obj.model_set_changed("invalid_field_name")
 
 
+def test_set_changed_will_not_change_anything_for_invalid_field_names():
+    obj = SomethingMultipleFields(id=1, foo="bar")
+
+    with pytest.raises(AttributeError):
+        obj.model_set_changed("id", "invalid_field_name")
+
+    assert obj.model_has_changed is False
+    assert obj.model_original == {}
+
+
 @pytest.mark.skipif(PYDANTIC_V1, reason="pydantic v1 does not support model_copy()")
 def test_copy_keeps_state():
     obj = Something(id=1)
 
-    assert not obj.model_copy().model_has_changed
-    assert obj.model_copy().model_changed_fields == set()
+    copied = obj.model_copy()
+    assert not copied.model_has_changed
+    assert copied.model_changed_fields == set()
 
     obj.id = 2
 
-    assert obj.model_copy().model_has_changed
-    assert obj.model_copy().model_changed_fields == {"id"}
+    copied = obj.model_copy()
+    assert copied.model_has_changed
+    assert copied.model_changed_fields == {"id"}
 
 
 # Test on pydantic v2, too - pydantic has a compatibility layer for this
@@ -136,16 +225,16 @@ def test_copy_keeps_state_with_v1_api():
     obj = Something(id=1)
 
     with pytest.warns(DeprecationWarning):
-        assert not obj.copy().model_has_changed
-    with pytest.warns(DeprecationWarning):
-        assert obj.copy().model_changed_fields == set()
+        copied = obj.copy()
+    assert not copied.model_has_changed
+    assert copied.model_changed_fields == set()
 
     obj.id = 2
 
     with pytest.warns(DeprecationWarning):
-        assert obj.copy().model_has_changed
-    with pytest.warns(DeprecationWarning):
-        assert obj.copy().model_changed_fields == {"id"}
+        copied = obj.copy()
+    assert copied.model_has_changed
+    assert copied.model_changed_fields == {"id"}
 
 
 @pytest.mark.skipif(PYDANTIC_V1, reason="pydantic v1 does not support model_dump()")
@@ -236,6 +325,20 @@ def test_export_include_is_intersect():
 
     assert something.model_dump(exclude_unchanged=True, include=set()) == {}
     assert something.model_dump(exclude_unchanged=True, include={'id'}) == {"id": 2}
+    assert something.model_dump(exclude_unchanged=True, include={'id': True, 'name': True}) == {"id": 2}
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="pydantic v1 does not support model_dump()")
+def test_export_include_is_intersect_for_nested_fields():
+    nested = NestedList(sub=[Something(id=1)])
+
+    assert nested.model_dump(exclude_unchanged=True, include={'sub'}) == {}
+
+    nested.sub[0].id = 2
+
+    assert nested.model_dump(exclude_unchanged=True, include={'sub'}) == {"sub": [{"id": 2}]}
+    assert nested.model_dump(exclude_unchanged=True, include={'sub': True}) == {"sub": [{"id": 2}]}
+    assert nested.model_dump(exclude_unchanged=True, include={'other'}) == {}
 
 
 @pytest.mark.skipif(PYDANTIC_V1, reason="pydantic v1 does not trigger warnings")
@@ -303,16 +406,32 @@ def test_changed_base_is_resetable_with_v1_api():
     assert something.dict(exclude_unchanged=True) == {}
 
 
+@pytest.mark.parametrize("copy_function", [copy.copy, copy.deepcopy])
+def test_copy_module_does_not_share_state(copy_function):
+    obj = Something(id=1)
+    obj.id = 2
+
+    clone = copy_function(obj)
+    assert clone.model_changed_fields == {"id"}
+
+    clone.model_set_changed("id", original=3)
+    clone.model_mark_changed("marker")
+    assert obj.model_original == {"id": 1}
+    assert obj.model_changed_markers == set()
+
+
 def test_pickle_keeps_state():
     obj = Something(id=1)
 
-    assert not pickle.loads(pickle.dumps(obj)).model_has_changed  # noqa: S301
-    assert pickle.loads(pickle.dumps(obj)).model_changed_fields == set()  # noqa: S301
+    restored = pickle.loads(pickle.dumps(obj))  # noqa: S301
+    assert not restored.model_has_changed
+    assert restored.model_changed_fields == set()
 
     obj.id = 2
 
-    assert pickle.loads(pickle.dumps(obj)).model_has_changed  # noqa: S301
-    assert pickle.loads(pickle.dumps(obj)).model_changed_fields == {"id"}  # noqa: S301
+    restored = pickle.loads(pickle.dumps(obj))  # noqa: S301
+    assert restored.model_has_changed
+    assert restored.model_changed_fields == {"id"}
 
 
 def test_pickle_even_works_when_changed_state_is_missing():
@@ -320,8 +439,9 @@ def test_pickle_even_works_when_changed_state_is_missing():
     obj.id = 2
 
     # Now we cannot use the changed state, but nothing fails
-    assert not pickle.loads(pickle.dumps(obj)).model_has_changed  # noqa: S301
-    assert pickle.loads(pickle.dumps(obj)).model_changed_fields == set()  # noqa: S301
+    restored = pickle.loads(pickle.dumps(obj))  # noqa: S301
+    assert not restored.model_has_changed
+    assert restored.model_changed_fields == set()
 
 
 def test_stores_original():
@@ -348,49 +468,34 @@ def test_nested_changed_state():
     assert parent.sub.model_has_changed
     assert "id" in parent.sub.model_original
     assert parent.sub.model_original == {"id": 1}
-    assert parent.model_self_changed_fields == set()
+    assert parent.sub.model_self_changed_fields == {"id"}
     assert parent.sub.model_changed_fields == {"id"}
     assert parent.sub.model_changed_fields_recursive == {"id"}
 
 
 @pytest.mark.parametrize(
-    ("parent_class", "list_type"), [
-        (NestedList, list),
-        (NestedTuple, tuple),
+    ("parent_class", "container_factory", "key"), [
+        (NestedList, lambda value: [value], 0),
+        (NestedTuple, lambda value: (value,), 0),
+        (NestedDict, lambda value: {"something": value}, "something"),
     ],
 )
-def test_nested_list(parent_class, list_type):
+def test_nested_container(parent_class, container_factory, key):
     something = Something(id=1)
-    parent = parent_class(sub=list_type([something]))
+    parent = parent_class(sub=container_factory(something))
 
     # Nothing changed so far
     assert something.model_has_changed is False
     assert parent.model_has_changed is False
 
     # Change something inside parent
-    parent.sub[0].id = 2
-    assert parent.sub[0].model_has_changed is True
+    child = parent.sub[key]
+    child.id = 2
+    assert child.model_has_changed is True
     assert parent.model_has_changed is True
     assert parent.model_self_changed_fields == set()
     assert parent.model_changed_fields == {'sub'}
-    assert parent.model_changed_fields_recursive == {'sub', 'sub.0', 'sub.0.id'}
-
-
-def test_nested_dict():
-    something = Something(id=1)
-    parent = NestedDict(sub={"something": something})
-
-    # Nothing changed so far
-    assert something.model_has_changed is False
-    assert parent.model_has_changed is False
-
-    # Change something inside parent
-    parent.sub["something"].id = 2
-    assert parent.sub["something"].model_has_changed is True
-    assert parent.model_has_changed is True
-    assert parent.model_self_changed_fields == set()
-    assert parent.model_changed_fields == {'sub'}
-    assert parent.model_changed_fields_recursive == {'sub', 'sub.something', 'sub.something.id'}
+    assert parent.model_changed_fields_recursive == {'sub', f'sub.{key}', f'sub.{key}.id'}
 
 
 def test_nested_unsupported():
@@ -421,10 +526,112 @@ def test_nested_with_default():
     assert parent.model_changed_fields_recursive == {"sub", "sub.id"}
 
 
-def test_use_private_attributes_works():
-    class SomethingPrivate(Something):
-        _private: Optional[int] = pydantic.PrivateAttr(None)
+def test_nested_deep_recursive():
+    parent = NestedDeep(sub=[Nested(sub=Something(id=1)), Nested(sub=Something(id=1))])
+
+    assert parent.model_changed_fields_recursive == set()
+
+    parent.sub[1].sub.id = 2
+    assert parent.model_changed_fields == {"sub"}
+    assert parent.model_changed_fields_recursive == {"sub", "sub.1", "sub.1.sub", "sub.1.sub.id"}
+
+    parent.sub[0].sub = Something(id=3)
+    assert parent.model_changed_fields_recursive == {
+        "sub", "sub.0", "sub.0.sub", "sub.1", "sub.1.sub", "sub.1.sub.id",
+    }
+
+
+def test_nested_any():
+    something = Something(id=1)
+    parent = NestedAny(sub=something)
+
+    assert parent.model_has_changed is False
+
+    parent.sub.id = 2
+    assert parent.model_has_changed
+    assert parent.model_changed_fields == {"sub"}
+    assert parent.model_changed_fields_recursive == {"sub", "sub.id"}
+
+
+def test_nested_change_detect_fields():
+    assert Something._model_nested_change_detect_fields() == frozenset()
+    assert NestedAny._model_nested_change_detect_fields() == frozenset()
+    assert Nested._model_nested_change_detect_fields() == {"sub"}
+    assert NestedList._model_nested_change_detect_fields() == {"sub"}
+    assert NestedDict._model_nested_change_detect_fields() == {"sub"}
+    assert NestedUnsupported._model_nested_change_detect_fields() == {"sub"}
+
+
+def test_change_detect_fields():
+    assert SomethingMultipleFields._model_change_detect_fields() == (("id", False), ("foo", False))
+    assert NestedAny._model_change_detect_fields() == (("sub", False),)
+    assert NestedList._model_change_detect_fields() == (("sub", True),)
+
+
+def test_validated_assignment_uses_validated_value():
+    obj = SomethingValidated(id=1)
+
+    obj.id = "1"
+    assert obj.model_has_changed is False
+
+    obj.id = "2"
+    assert obj.id == 2
+    assert obj.model_has_changed
+    assert obj.model_original == {"id": 1}
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="pydantic v1 does not support model_post_init()")
+@pytest.mark.parametrize(
+    "model_class", [SomethingPostInitWithoutSuper, SomethingPrivatePostInitWithoutSuper],
+)
+def test_model_post_init_overrides_still_reset_changed_state(model_class):
+    for obj in (
+        model_class(id=1),
+        model_class.model_validate({"id": 1}),
+    ):
+        assert obj.model_has_changed is False
+        obj.id = 2
+        assert obj.model_changed_fields == {"id"}
 
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="pydantic v1 does not support model_post_init()")
+@pytest.mark.parametrize(
+    "model_class", [SomethingPostInitWithSuper, SomethingPrivatePostInitWithSuper],
+)
+def test_model_post_init_overrides_with_super_still_reset_changed_state(model_class):
+    obj = model_class(id=1)
+    assert obj.id == 2
+    assert obj.model_has_changed is False
+    assert obj.model_original == {}
+
+
+@pytest.mark.skipif(PYDANTIC_V1, reason="pydantic v1 does not support model_post_init()")
+@pytest.mark.parametrize(
+    "model_class", [
+        SomethingInheritedPostInit,
+        SomethingInheritedPostInitSubclass,
+        SomethingPrivateInheritedPostInit,
+    ],
+)
+def test_inherited_model_post_init_still_resets_changed_state(model_class):
+    obj = model_class(id=1)
+    assert obj.model_has_changed is False
+    obj.id = 2
+    assert obj.model_changed_fields == {"id"}
+    assert obj.model_original == {"id": 1}
+
+
+def test_unknown_attributes_are_rejected_by_pydantic():
+    obj = Something(id=1)
+
+    with pytest.raises(ValueError, match="no field"):
+        obj.unknown = 1
+
+    assert obj.model_has_changed is False
+    assert obj.model_self_changed_fields == set()
+
+
+def test_use_private_attributes_works():
     something = SomethingPrivate(id=1)
 
     assert something.model_has_changed is False
@@ -473,6 +680,47 @@ def test_value_types_checked_for_equality(
     assert obj.model_has_changed is expected
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (None, True),
+        ("value", True),
+        (Something(id=1), True),
+        ([1, "2", None], True),
+        ((1, [2, (3,)]), True),
+        ({1, 2}, True),
+        ({"a": [1, {"b": decimal.Decimal(1)}]}, True),
+        ([], True),
+        (object(), False),
+        ([1, object()], False),
+        ({"a": object()}, False),
+        ({frozenset(): 1}, False),
+        ([[[object()]]], False),
+    ],
+)
+def test_value_is_comparable_type(value: Any, expected: bool):
+    assert Something(id=1)._model_value_is_comparable_type(value) is expected
+
+
+def test_value_with_cyclic_container_is_handled():
+    cyclic: list[Any] = [1]
+    cyclic.append(cyclic)
+    obj = NestedAny(sub=None)
+
+    assert obj._model_value_is_comparable_type(cyclic) is True
+
+    obj.sub = cyclic
+    assert obj.model_changed_fields == {"sub"}
+    assert obj.model_original == {"sub": None}
+
+    obj.model_reset_changed()
+    obj.sub = cyclic
+    assert obj.model_has_changed is False
+
+    cyclic.append(object())
+    assert obj._model_value_is_comparable_type(cyclic) is False
+
+
 @pytest.mark.skipif(PYDANTIC_V1, reason="pydantic v1 does not support model_construct()")
 def test_model_construct_works():
     something = Something.model_construct(id=1)
@@ -494,6 +742,9 @@ def test_model_construct_works_for_models_loaded_with_few_fields():
 
     assert something_multiple_fields.model_has_changed is True
 
+    with pytest.raises(AttributeError, match="not available"):
+        something_multiple_fields.model_get_original_field_value("foo")
+
 
 @pytest.mark.skipif(PYDANTIC_V1, reason="pydantic v1 does not trigger warnings")
 def test_construct_works_on_v2():
@@ -521,57 +772,42 @@ def test_construct_works_on_v1():
 def test_compatibility_methods_work():
     something = Something(id=1)
 
-    with pytest.warns(DeprecationWarning):
+    # Each deprecated call needs to trigger its own warning
+    with pytest.warns(DeprecationWarning) as record:
         assert something.has_changed is False
-    with pytest.warns(DeprecationWarning):
         assert not something.__self_changed_fields__
-    with pytest.warns(DeprecationWarning):
         assert not something.__changed_fields__
-    with pytest.warns(DeprecationWarning):
         assert not something.__changed_fields_recursive__
-    with pytest.warns(DeprecationWarning):
         assert something.__original__ == {}
+    assert len(record) == 5
 
     something.id = 2
 
-    with pytest.warns(DeprecationWarning):
+    with pytest.warns(DeprecationWarning) as record:
         assert something.has_changed is True
-    with pytest.warns(DeprecationWarning):
         assert something.__self_changed_fields__ == {"id"}
-    with pytest.warns(DeprecationWarning):
         assert something.__changed_fields__ == {"id"}
-    with pytest.warns(DeprecationWarning):
         assert something.__changed_fields_recursive__ == {"id"}
-    with pytest.warns(DeprecationWarning):
         assert something.__original__ == {"id": 1}
+    assert len(record) == 5
 
-    with pytest.warns(DeprecationWarning):
+    with pytest.warns(DeprecationWarning) as record:
         something.reset_changed()
-
-    with pytest.warns(DeprecationWarning):
         assert something.has_changed is False
-    with pytest.warns(DeprecationWarning):
         assert not something.__self_changed_fields__
-    with pytest.warns(DeprecationWarning):
         assert not something.__changed_fields__
-    with pytest.warns(DeprecationWarning):
         assert not something.__changed_fields_recursive__
-    with pytest.warns(DeprecationWarning):
         assert something.__original__ == {}
+    assert len(record) == 6
 
-    with pytest.warns(DeprecationWarning):
+    with pytest.warns(DeprecationWarning) as record:
         something.set_changed("id", original=1)
-
-    with pytest.warns(DeprecationWarning):
         assert something.has_changed is True
-    with pytest.warns(DeprecationWarning):
         assert something.__self_changed_fields__ == {"id"}
-    with pytest.warns(DeprecationWarning):
         assert something.__changed_fields__ == {"id"}
-    with pytest.warns(DeprecationWarning):
         assert something.__changed_fields_recursive__ == {"id"}
-    with pytest.warns(DeprecationWarning):
         assert something.__original__ == {"id": 1}
+    assert len(record) == 6
 
 
 # Restore model/value state
@@ -670,6 +906,24 @@ def test_restore_field_value_nested():
     assert nested.model_get_original_field_value("sub") == Something(id=1)
 
 
+def test_restore_value_copies_containers():
+    plain_list = [1, "2", 3.0]
+    restored_list = Something.model_restore_value(plain_list)
+    assert restored_list == plain_list
+    assert restored_list is not plain_list
+
+    plain_dict = {"a": 1, "b": "2"}
+    restored_dict = Something.model_restore_value(plain_dict)
+    assert restored_dict == plain_dict
+    assert restored_dict is not plain_dict
+
+    something = Something(id=1)
+    something.id = 2
+    mixed_list = [1, something]
+    assert Something.model_restore_value(mixed_list) == [1, Something(id=1)]
+    assert Something.model_restore_value({"a": 1, "b": something}) == {"a": 1, "b": Something(id=1)}
+
+
 # Changed markers
 
 
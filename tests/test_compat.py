@@ -0,0 +1,30 @@
+import pydantic
+
+from pydantic_changedetect import ChangeDetectionMixin
+from pydantic_changedetect._compat import get_pydantic_compat
+
+
+class Something(ChangeDetectionMixin, pydantic.BaseModel):
+    id: int
+
+
+class SomethingExtended(Something):
+    name: str
+
+
+def test_pydantic_compat_is_cached_per_model():
+    assert get_pydantic_compat(Something) is get_pydantic_compat(Something)
+    assert get_pydantic_compat(SomethingExtended) is get_pydantic_compat(SomethingExtended)
+
+
+def test_pydantic_compat_is_not_shared_with_subclasses():
+    assert set(get_pydantic_compat(Something).model_fields) == {"id"}
+    assert set(get_pydantic_compat(SomethingExtended).model_fields) == {"id", "name"}
+
+
+def test_pydantic_compat_field_annotations():
+    compat = get_pydantic_compat(SomethingExtended)
+
+    assert compat.model_field_annotations == {"id": int, "name": str}
+    assert compat.get_model_field_info_annotation(compat.model_fields["id"]) is int
+    assert compat.get_model_field_info_annotation(compat.model_fields["name"]) is str
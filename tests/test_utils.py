@@ -28,16 +28,13 @@ def test_safe_issubclass():
         assert safe_issubclass(AbstractClass, BaseClass)
 
 
-def test_safe_issubclass_for_type_definitions():
+@pytest.mark.parametrize(
+    "type_definition",
+    [List[str], Dict[str, str], list[str], dict[str, str]],
+)
+def test_safe_issubclass_for_type_definitions(type_definition):
     with pytest.warns(DeprecationWarning):
-        assert safe_issubclass(list[str], BaseClass) is False
-    with pytest.warns(DeprecationWarning):
-        assert safe_issubclass(dict[str, str], BaseClass) is False
-
-    with pytest.warns(DeprecationWarning):
-        assert safe_issubclass(list[str], BaseClass) is False
-    with pytest.warns(DeprecationWarning):
-        assert safe_issubclass(dict[str, str], BaseClass) is False
+        assert safe_issubclass(type_definition, BaseClass) is False
 
 
 def test_ensure_normal_issubclass_raises_an_issue():
@@ -45,16 +42,13 @@ def test_ensure_normal_issubclass_raises_an_issue():
         issubclass(list[str], AbstractClass)
 
 
-def test_safe_issubclass_for_type_definitions_for_abstract():
-    with pytest.warns(DeprecationWarning):
-        assert safe_issubclass(list[str], AbstractClass) is False
-    with pytest.warns(DeprecationWarning):
-        assert safe_issubclass(dict[str, str], AbstractClass) is False
-
-    with pytest.warns(DeprecationWarning):
-        assert safe_issubclass(list[str], AbstractClass) is False
+@pytest.mark.parametrize(
+    "type_definition",
+    [List[str], Dict[str, str], list[str], dict[str, str]],
+)
+def test_safe_issubclass_for_type_definitions_for_abstract(type_definition):
     with pytest.warns(DeprecationWarning):
-        assert safe_issubclass(dict[str, str], AbstractClass) is False
+        assert safe_issubclass(type_definition, AbstractClass) is False
 
 
 class SomeModel(ChangeDetectionMixin, pydantic.BaseModel):